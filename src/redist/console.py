@@ -9,9 +9,11 @@ LogLevel: TypeAlias = Literal["debug", "notice", "warning", "error"]
 CONSOLE: Final = Console(stderr=True)
 
 if "GITHUB_ACTIONS" in environ:
+    GHA_ESCAPES: Final = str.maketrans({"%": "%25", "\n": "%0A", "\r": "%0D"})
+
+
     def log(level: LogLevel, message: Any) -> None:
-        message = str(message).replace("%", "%25").replace("\n", "%0A").replace("\r", "%0D")  # TODO
-        CONSOLE.print(f"::{level}::{message}")
+        CONSOLE.print(f"::{level}::{str(message).translate(GHA_ESCAPES)}")  # TODO
 else:
     LOG_COLORS: Final = dict(debug="bright black", notice="blue", warning="yellow", error="red")
 
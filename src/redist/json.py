@@ -1,5 +1 @@
-from typing import Final
-
-from simdjson import Parser
-
-JSON_PARSER: Final = Parser()
+from simdjson import Parser as Parser
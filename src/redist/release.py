@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
 from re import Pattern
 from typing import Mapping, Any, Final, final, Iterable
 
+_MAGIC: Final = re.compile(r"[\\^$.|?*+()\[\]{}]")
+
 
 @final
 class Asset:
@@ -57,7 +60,15 @@ class Release:
         assets = (Asset(it, self) for it in self.__data["assets"])
         if asset_filter is None:
             return assets
-        return (it for it in assets if asset_filter.match(it.name))
+        pattern = asset_filter.pattern.removeprefix(r"\A")
+        if pattern.endswith(r"\Z"):
+            literal = pattern.removesuffix(r"\Z")
+            if _MAGIC.search(literal) is None:
+                return (it for it in assets if it.name == literal)
+        elif _MAGIC.search(pattern) is None:
+            return (it for it in assets if it.name.startswith(pattern))
+        match = asset_filter.match
+        return (it for it in assets if match(it.name))
 
     @property
     def tag(self) -> str:
@@ -1,9 +1,13 @@
 from abc import ABC
+from concurrent.futures import ThreadPoolExecutor
 from re import Pattern
 from typing import final, Final, Iterable
+from urllib.parse import parse_qs, urlsplit
 
-from redist.http import SESSION, ACCEPT_JSON
-from redist.json import JSON_PARSER
+from requests import Response
+
+from redist.http import get_session, ACCEPT_JSON
+from redist.json import Parser
 from redist.release import Release
 
 
@@ -28,25 +32,42 @@ class GHRepo(Repo, ABC):
 
     def releases(self) -> Iterable[Release]:
         url = f"{self.__base_url}/repos/{self.__repo}/releases?per_page=100"
-        while True:
-            response = SESSION.get(url, headers=ACCEPT_JSON)
-            response.raise_for_status()
-            yield from map(Release, JSON_PARSER.parse(response.content, recursive=True))
-            if "next" not in response.links:
-                break
-            url = response.links["next"]["url"]
+        response = self.__get(url)
+        yield from self.__parse(response)
+        last = response.links.get("last")
+        if last is None:
+            return
+        last_page = int(parse_qs(urlsplit(last["url"]).query)["page"][0])
+        with ThreadPoolExecutor() as executor:
+            for response in executor.map(self.__get, (f"{url}&page={page}" for page in range(2, last_page + 1))):
+                yield from self.__parse(response)
+
+    @staticmethod
+    def __get(url: str) -> Response:
+        response = get_session().get(url, headers=ACCEPT_JSON)
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    def __parse(response: Response) -> Iterable[Release]:
+        # One parser per page: reusing a parser invalidates its previous
+        # document, and the lazy proxies must stay valid for as long as the
+        # caller holds on to the releases.
+        return map(Release, Parser().parse(response.content))
 
 
 @final
 class GHSrcRepo(GHRepo, SrcRepo):
     def releases(self, tag_filter: Pattern | None = None, *ignore: Release) -> Iterable[Release]:
         if tag_filter is None:
-            if ignore is None:
+            if not ignore:
                 return super().releases()
-            return (it for it in super().releases() if it not in ignore)
-        elif ignore is None:
+            ignored = frozenset(ignore)
+            return (it for it in super().releases() if it not in ignored)
+        elif not ignore:
             return (it for it in super().releases() if tag_filter.match(it.tag))
-        return (it for it in super().releases() if it not in ignore and tag_filter.match(it.tag))
+        ignored = frozenset(ignore)
+        return (it for it in super().releases() if it not in ignored and tag_filter.match(it.tag))
 
 
 @final